@@ -1,6 +1,130 @@
+import atexit
+import bisect
+import csv
 import heapq
-import json
-from datetime import datetime
+import os
+import sys
+from datetime import date, datetime
+from functools import lru_cache
+
+try:
+    import orjson  # Serializador JSON rápido (opcional)
+except ImportError:
+    import json
+
+    class orjson:
+        """
+        Sustituto mínimo de orjson basado en el módulo json estándar.
+        Trabaja con bytes, igual que orjson.
+        """
+        @staticmethod
+        def dumps(obj):
+            return json.dumps(obj).encode("utf-8")
+
+        @staticmethod
+        def loads(datos):
+            return json.loads(datos)
+
+
+_VERSION_INSTANTANEA = 1  # Versión del formato del archivo de persistencia
+_SIN_DEPENDENCIAS = frozenset()  # Conjunto vacío compartido por las tareas sin dependencias
+
+
+def _dependencias(nombres):
+    """
+    Devuelve las dependencias como frozenset, reutilizando el conjunto vacío compartido.
+    """
+    return frozenset(nombres) if nombres else _SIN_DEPENDENCIAS
+
+
+@lru_cache(maxsize=None)
+def _fecha_iso(ordinal):
+    """
+    Convierte una fecha ordinal a texto 'YYYY-MM-DD'.
+    Muchas tareas comparten fecha, así que cada conversión se calcula una sola vez.
+    """
+    return date.fromordinal(ordinal).isoformat()
+
+
+def _tarea_a_json(tarea):
+    """
+    Convierte una tarea en una lista serializable (el frozenset de dependencias pasa a lista).
+    """
+    prioridad, fecha, nombre, dependencias = tarea
+    return [prioridad, fecha, nombre, sorted(dependencias)]
+
+
+def _tarea_desde_json(datos):
+    """
+    Reconstruye una tarea leída de JSON como tupla con sus dependencias en un frozenset.
+    Las fechas en formato ISO de versiones anteriores se convierten a ordinal.
+    """
+    prioridad, fecha, nombre, dependencias = datos
+    if isinstance(fecha, str):
+        fecha = datetime.fromisoformat(fecha).toordinal()
+    return (prioridad, fecha, nombre, _dependencias(dependencias))
+
+
+def _linea_registro(operacion):
+    """
+    Serializa una operación como línea del registro (JSONL).
+    orjson no admite enteros de más de 64 bits: el error se traduce a ValueError.
+    """
+    try:
+        return orjson.dumps(operacion) + b"\n"
+    except TypeError as e:
+        raise ValueError(f"No se puede guardar la tarea: {e}") from None
+
+
+def _nombres_unicos(tareas):
+    """
+    Renombra las tareas con nombre repetido (las versiones anteriores lo permitían)
+    para no perder ninguna al cargarlas. Avisa de cada tarea renombrada.
+    """
+    usados = {tarea[2] for tarea in tareas}
+    vistos = set()
+    resultado = []
+    for prioridad, fecha, nombre, dependencias in tareas:
+        if nombre in vistos:
+            sufijo = 2
+            while f"{nombre} ({sufijo})" in usados:
+                sufijo += 1
+            nuevo = f"{nombre} ({sufijo})"
+            usados.add(nuevo)
+            print(f"Aviso: ya había una tarea pendiente llamada '{nombre}'; esta se ha renombrado como '{nuevo}'.")
+            nombre = nuevo
+        vistos.add(nombre)
+        resultado.append((prioridad, fecha, nombre, dependencias))
+    return resultado
+
+
+def leer_tareas_csv(ruta):
+    """
+    Lee tareas de un archivo CSV con columnas: nombre, prioridad, fecha y,
+    opcionalmente, dependencias separadas por punto y coma.
+    Devuelve una lista de tuplas (nombre, prioridad, fecha_vencimiento, dependencias).
+    """
+    tareas = []
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        for numero, fila in enumerate(csv.reader(archivo), 1):
+            if not fila or not "".join(fila).strip():
+                continue  # Ignoramos las líneas vacías
+            if len(fila) < 3:
+                raise ValueError(f"Línea {numero} del CSV: se esperaban al menos 3 campos (nombre, prioridad, fecha).")
+            nombre, prioridad, fecha_vencimiento = (campo.strip() for campo in fila[:3])
+            try:
+                prioridad = int(prioridad)
+            except ValueError:
+                raise ValueError(f"Línea {numero} del CSV: la prioridad '{prioridad}' no es un número entero.") from None
+            try:
+                date.fromisoformat(fecha_vencimiento)
+            except ValueError:
+                raise ValueError(f"Línea {numero} del CSV: la fecha '{fecha_vencimiento}' no tiene el formato YYYY-MM-DD.") from None
+            dependencias = fila[3].split(";") if len(fila) > 3 else []
+            dependencias = [dep.strip() for dep in dependencias if dep.strip()]
+            tareas.append((nombre, prioridad, fecha_vencimiento, dependencias))
+    return tareas
+
 
 class GestorTareas:
     def __init__(self, archivo_persistencia="tareas.json"):
@@ -10,113 +134,312 @@ class GestorTareas:
         """
         self.heap = []  # Lista que actuará como un heap para gestionar tareas
         self.tareas_completadas = set()  # Conjunto para almacenar tareas completadas
+        self._pos = {}  # Posición de cada tarea en el heap, indexada por nombre
+        self._ordenadas = None  # Vista ordenada de las tareas (se construye bajo demanda)
         self.archivo_persistencia = archivo_persistencia  # Archivo para persistencia
+        self.archivo_registro = archivo_persistencia + ".log"  # Registro de operaciones (JSONL)
+        self._log = None  # Archivo de registro abierto en modo añadir (se abre al primer uso)
+        self._entradas_log = 0  # Número de operaciones en el registro desde la última compactación
+        self._dirty = False  # Indica si hay operaciones sin volcar a disco
         self.cargar_tareas()  # Carga las tareas desde el archivo
 
     def guardar_tareas(self):
         """
-        Guarda las tareas actuales en un archivo JSON.
+        Guarda las tareas actuales en un archivo JSON y vacía el registro de operaciones.
+        Compacta así el registro en una única instantánea.
+        """
+        temporal = self.archivo_persistencia + ".tmp"
+        with open(temporal, "wb") as archivo:
+            # Las tareas se escriben en el orden del heap: al cargar no hace falta reordenarlas
+            instantanea = {"v": _VERSION_INSTANTANEA, "heap": [_tarea_a_json(tarea) for tarea in self.heap]}
+            archivo.write(orjson.dumps(instantanea))
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, self.archivo_persistencia)  # Sustitución atómica de la instantánea
+
+        # La instantánea ya incluye todas las operaciones: truncamos el registro
+        self._abrir_registro("wb")
+        self._entradas_log = 0
+        self._dirty = False
+
+    def _subir(self, i):
+        """
+        Desplaza la tarea de la posición i hacia la raíz hasta restaurar el heap.
+        Mantiene actualizado el índice de posiciones.
+        """
+        tarea = self.heap[i]
+        while i > 0:
+            padre = (i - 1) >> 1
+            if tarea < self.heap[padre]:
+                self.heap[i] = self.heap[padre]
+                self._pos[self.heap[i][2]] = i
+                i = padre
+            else:
+                break
+        self.heap[i] = tarea
+        self._pos[tarea[2]] = i
+
+    def _bajar(self, i):
+        """
+        Desplaza la tarea de la posición i hacia las hojas hasta restaurar el heap.
+        Mantiene actualizado el índice de posiciones.
+        """
+        n = len(self.heap)
+        tarea = self.heap[i]
+        while True:
+            hijo = 2 * i + 1
+            if hijo >= n:
+                break
+            if hijo + 1 < n and self.heap[hijo + 1] < self.heap[hijo]:
+                hijo += 1  # Elegimos el hijo de mayor prioridad
+            if self.heap[hijo] < tarea:
+                self.heap[i] = self.heap[hijo]
+                self._pos[self.heap[i][2]] = i
+                i = hijo
+            else:
+                break
+        self.heap[i] = tarea
+        self._pos[tarea[2]] = i
+
+    def _insertar(self, tarea):
+        """
+        Inserta una tarea en el heap en O(log n).
+        """
+        self.heap.append(tarea)
+        self._subir(len(self.heap) - 1)
+
+    def _eliminar(self, nombre):
+        """
+        Elimina una tarea del heap por nombre en O(log n).
+        La última tarea ocupa su hueco y se recoloca hacia arriba o hacia abajo.
+        Devuelve la tarea eliminada.
+        """
+        i = self._pos.pop(nombre)
+        tarea = self.heap[i]
+        ultima = self.heap.pop()
+        if i < len(self.heap):
+            self.heap[i] = ultima
+            self._pos[ultima[2]] = i
+            self._subir(i)
+            self._bajar(self._pos[ultima[2]])
+        return tarea
+
+    def _tareas_ordenadas(self):
+        """
+        Devuelve las tareas ordenadas por prioridad y fecha.
+        La ordenación completa solo se hace la primera vez; después la vista
+        se mantiene al día en cada inserción y eliminación.
         """
-        with open(self.archivo_persistencia, "w") as archivo:
-            json.dump(self.heap, archivo)
+        if self._ordenadas is None:
+            # Las tuplas se comparan lexicográficamente: prioridad, fecha, nombre
+            self._ordenadas = sorted(self.heap)
+        return self._ordenadas
+
+    def _abrir_registro(self, modo):
+        """
+        Abre (o reabre) el archivo de registro en el modo indicado.
+        Mientras esté abierto, se cierra automáticamente al salir del programa.
+        """
+        if self._log is None:
+            atexit.register(self.cerrar)  # Guardamos los cambios pendientes al salir
+        else:
+            self._log.close()
+        self._log = open(self.archivo_registro, modo)
+
+    def _registrar(self, linea):
+        """
+        Añade una línea ya serializada al final del registro. Coste O(1) por modificación.
+        """
+        if self._log is None:
+            self._abrir_registro("ab")
+        self._log.write(linea)
+        self._entradas_log += 1
+        self._dirty = True
+
+    def _flush(self):
+        """
+        Vuelca a disco las operaciones pendientes del registro.
+        Si el registro ha crecido más del doble que el heap, lo compacta.
+        """
+        if not self._dirty:
+            return
+        if self._entradas_log > 2 * len(self.heap):
+            self.guardar_tareas()
+        else:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._dirty = False
+
+    def cerrar(self):
+        """
+        Vuelca los cambios pendientes y cierra el archivo de registro.
+        El gestor puede seguir usándose: el registro se reabre al necesitarlo.
+        """
+        self._flush()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+            atexit.unregister(self.cerrar)  # Ya no hace falta cerrarlo al salir
 
     def cargar_tareas(self):
         """
-        Carga las tareas desde un archivo JSON si existe.
+        Carga las tareas desde un archivo JSON si existe
+        y reproduce después las operaciones del registro.
         """
-        try:
-            with open(self.archivo_persistencia, "r") as archivo:
-                self.heap = json.load(archivo)
+        datos = None  # Si el archivo no existe, empezamos sin tareas
+        if os.path.exists(self.archivo_persistencia):
+            with open(self.archivo_persistencia, "rb") as archivo:
+                datos = orjson.loads(archivo.read())
+
+        if isinstance(datos, dict) and datos.get("v") == _VERSION_INSTANTANEA:
+            # La instantánea se guardó en orden de heap: no hace falta heapify
+            self.heap = [_tarea_desde_json(tarea) for tarea in datos["heap"]]
+            self._pos = {tarea[2]: i for i, tarea in enumerate(self.heap)}
+            if len(self._pos) != len(self.heap):
+                # Nombres repetidos: el índice no es fiable, renombramos y reconstruimos
+                self.heap = _nombres_unicos(self.heap)
+                heapq.heapify(self.heap)
+                self._pos = {tarea[2]: i for i, tarea in enumerate(self.heap)}
+        else:
+            if isinstance(datos, dict):
+                # Otra versión de instantánea: no confiamos en el orden guardado
+                if not isinstance(datos.get("heap"), list):
+                    raise ValueError(f"Versión de instantánea no soportada: {datos.get('v')}")
+                lista = datos["heap"]
+            elif isinstance(datos, list):
+                lista = datos  # Formato antiguo: lista sin versión
+            else:
+                lista = []
+            # Puede haber nombres repetidos y fechas ISO: renombramos y reconstruimos el heap
+            self.heap = _nombres_unicos([_tarea_desde_json(tarea) for tarea in lista])
             heapq.heapify(self.heap)  # Convierte la lista cargada en un heap válido
-        except FileNotFoundError:
-            self.heap = []  # Si el archivo no existe, inicializamos una lista vacía
+            self._pos = {tarea[2]: i for i, tarea in enumerate(self.heap)}
+        self._ordenadas = None
+
+        # Reproducimos el registro con las operaciones del heap, que mantienen su invariante
+        if not os.path.exists(self.archivo_registro):
+            return  # Sin registro: la instantánea está al día
+        valido = 0  # Bytes del registro hasta la última operación correcta
+        rota = None  # Número de la línea que no se pudo leer
+        with open(self.archivo_registro, "rb") as registro:
+            for numero, linea in enumerate(registro, 1):
+                if rota is not None:
+                    # Solo la última línea puede quedar a medias: esto es corrupción real
+                    raise ValueError(f"Registro de operaciones corrupto en la línea {rota}: {self.archivo_registro}")
+                if not linea.endswith(b"\n"):
+                    rota = numero  # Escritura interrumpida antes del salto de línea
+                    continue
+                if not linea.strip():
+                    valido += len(linea)
+                    continue
+                try:
+                    operacion = orjson.loads(linea)
+                except ValueError:
+                    rota = numero
+                    continue
+                valido += len(linea)
+                if operacion["op"] == "add":
+                    tarea = _tarea_desde_json(operacion["t"])
+                    if tarea[2] in self._pos:
+                        self._eliminar(tarea[2])
+                    self._insertar(tarea)
+                elif operacion["op"] == "done" and operacion["nombre"] in self._pos:
+                    self._eliminar(operacion["nombre"])
+                self._entradas_log += 1
+
+        if rota is not None:
+            # La última escritura quedó incompleta: la descartamos para poder seguir añadiendo
+            os.truncate(self.archivo_registro, valido)
 
-    def añadir_tarea(self, nombre, prioridad, fecha_vencimiento, dependencias=[]):
+    def _crear_tarea(self, nombre, prioridad, fecha_vencimiento, dependencias=()):
         """
-        Añade una nueva tarea al sistema.
-        - nombre: Nombre de la tarea (cadena no vacía).
-        - prioridad: Número entero (menor significa mayor prioridad).
-        - fecha_vencimiento: Fecha en formato 'YYYY-MM-DD'.
-        - dependencias: Lista de nombres de tareas de las que depende.
+        Valida los datos de una tarea y construye su tupla (parámetros como en añadir_tarea).
         """
         if not nombre.strip():
             raise ValueError("El nombre de la tarea no puede estar vacío.")
         if not isinstance(prioridad, int):
             raise ValueError("La prioridad debe ser un número entero.")
+        if nombre in self._pos:
+            raise ValueError(f"Ya existe una tarea pendiente con el nombre: {nombre}.")
         
-        # Convertimos la fecha a un formato estándar ISO 8601
-        fecha = datetime.strptime(fecha_vencimiento, "%Y-%m-%d").isoformat()
-        tarea = (prioridad, fecha, nombre, dependencias)  # Creamos una tupla para la tarea
-        heapq.heappush(self.heap, tarea)  # Añadimos la tarea al heap
-        self.guardar_tareas()  # Guardamos los cambios en el archivo
+        # Guardamos la fecha como ordinal: un entero es más compacto y rápido de comparar
+        fecha = date.fromisoformat(fecha_vencimiento).toordinal()
+        # Guardamos las dependencias en un frozenset para comprobarlas como subconjunto
+        return (prioridad, fecha, nombre, _dependencias(dependencias))  # Creamos una tupla para la tarea
 
-    def mostrar_tareas_pendientes(self):
+    def añadir_tarea(self, nombre, prioridad, fecha_vencimiento, dependencias=()):
         """
-        Muestra todas las tareas pendientes ordenadas por prioridad y fecha de vencimiento.
-        Utiliza Merge Sort para realizar la ordenación.
+        Añade una nueva tarea al sistema.
+        - nombre: Nombre de la tarea (cadena no vacía).
+        - prioridad: Número entero (menor significa mayor prioridad).
+        - fecha_vencimiento: Fecha en formato 'YYYY-MM-DD' (se almacena como ordinal).
+        - dependencias: Nombres de las tareas de las que depende (no se modifica).
         """
-        # Ordenamos la lista usando Merge Sort
-        tareas_ordenadas = self.merge_sort(self.heap)
-        print("Tareas pendientes (ordenadas por prioridad y fecha):")
-        for tarea in tareas_ordenadas:
-            prioridad, fecha, nombre, dependencias = tarea
-            print(f"Nombre: {nombre}, Prioridad: {prioridad}, Fecha: {fecha}, Dependencias: {dependencias}")
+        tarea = self._crear_tarea(nombre, prioridad, fecha_vencimiento, dependencias)
+        # Serializamos antes de modificar nada: si falla, la tarea no queda a medias
+        linea = _linea_registro({"op": "add", "t": _tarea_a_json(tarea)})
+        self._insertar(tarea)  # Añadimos la tarea al heap
+        if self._ordenadas is not None:
+            bisect.insort(self._ordenadas, tarea)  # Mantenemos la vista ordenada sin reordenar
+        self._registrar(linea)  # Anotamos la operación en el registro
 
-    def merge_sort(self, lista):
+    def añadir_tareas_lote(self, tareas):
         """
-        Implementa el algoritmo Merge Sort para ordenar tareas.
-        - Divide la lista en mitades, las ordena recursivamente y luego las combina.
-        - Ordena por prioridad (primero) y fecha de vencimiento (segundo).
+        Añade varias tareas de una sola vez.
+        - tareas: Iterable de tuplas (nombre, prioridad, fecha_vencimiento[, dependencias]).
+        Se validan todas antes de modificar el heap, que se reconstruye con un
+        único heapify en O(n) en lugar de una inserción O(log n) por tarea.
         """
-        if len(lista) <= 1:
-            return lista  # Una lista de tamaño 1 ya está ordenada
-        
-        # Dividimos la lista en dos mitades
-        mitad = len(lista) // 2
-        izquierda = self.merge_sort(lista[:mitad])  # Ordenamos recursivamente la mitad izquierda
-        derecha = self.merge_sort(lista[mitad:])  # Ordenamos recursivamente la mitad derecha
-        
-        # Mezclamos ambas mitades ordenadas
-        return self.mezclar(izquierda, derecha)
+        nuevas = []
+        nombres = set()
+        for datos in tareas:
+            tarea = self._crear_tarea(*datos)
+            if tarea[2] in nombres:
+                raise ValueError(f"La tarea '{tarea[2]}' aparece repetida en el lote.")
+            nombres.add(tarea[2])
+            nuevas.append(tarea)
+        # Serializamos todo antes de modificar el heap: si algo falla, el lote no se aplica
+        lineas = [_linea_registro({"op": "add", "t": _tarea_a_json(tarea)}) for tarea in nuevas]
 
-    def mezclar(self, izquierda, derecha):
+        self.heap.extend(nuevas)
+        heapq.heapify(self.heap)
+        self._pos = {tarea[2]: i for i, tarea in enumerate(self.heap)}
+        if self._ordenadas is not None:
+            # Mezclamos las nuevas tareas con la vista ya ordenada: Timsort detecta
+            # el tramo existente y solo ordena y mezcla el nuevo
+            self._ordenadas.extend(nuevas)
+            self._ordenadas.sort()
+        for linea in lineas:
+            self._registrar(linea)  # Anotamos la operación en el registro
+        return len(nuevas)
+
+    def mostrar_tareas_pendientes(self):
         """
-        Mezcla dos listas ordenadas en una sola lista ordenada.
-        - Compara elementos de ambas listas para mantener el orden.
+        Muestra todas las tareas pendientes ordenadas por prioridad y fecha de vencimiento.
+        Utiliza una vista ordenada que solo se reconstruye cuando no existe.
         """
-        resultado = []  # Lista para almacenar el resultado de la mezcla
-        while izquierda and derecha:
-            # Comparamos las tareas por prioridad y luego por fecha
-            if (izquierda[0][0], izquierda[0][1]) <= (derecha[0][0], derecha[0][1]):
-                resultado.append(izquierda.pop(0))  # Añadimos el menor de la izquierda
-            else:
-                resultado.append(derecha.pop(0))  # Añadimos el menor de la derecha
-        
-        # Añadimos los elementos restantes de ambas listas
-        resultado.extend(izquierda or derecha)
-        return resultado
+        lineas = ["Tareas pendientes (ordenadas por prioridad y fecha):"]
+        lineas.extend(
+            f"Nombre: {nombre}, Prioridad: {prioridad}, Fecha: {_fecha_iso(fecha)}, Dependencias: {sorted(dependencias)}"
+            for prioridad, fecha, nombre, dependencias in self._tareas_ordenadas()
+        )
+        # Una sola escritura en lugar de un print por tarea
+        sys.stdout.write("\n".join(lineas) + "\n")
 
     def completar_tarea(self, nombre):
         """
         Marca una tarea como completada y la elimina del sistema.
         - nombre: Nombre de la tarea a completar.
         """
-        tarea_encontrada = False
-        nuevas_tareas = []
-        
-        # Procesamos todas las tareas del heap
-        while self.heap:
-            prioridad, fecha, nombre_tarea, dependencias = heapq.heappop(self.heap)
-            if nombre_tarea == nombre:
-                tarea_encontrada = True
-                self.tareas_completadas.add(nombre)  # Añadimos la tarea al conjunto de completadas
-            else:
-                nuevas_tareas.append((prioridad, fecha, nombre_tarea, dependencias))
-        
-        # Reconstruimos el heap con las tareas restantes
-        self.heap = nuevas_tareas
-        heapq.heapify(self.heap)
-        self.guardar_tareas()  # Guardamos los cambios en el archivo
+        # El índice de posiciones localiza la tarea sin recorrer el heap
+        tarea_encontrada = nombre in self._pos
+        if tarea_encontrada:
+            linea = _linea_registro({"op": "done", "nombre": nombre})
+            tarea = self._eliminar(nombre)  # Eliminación en O(log n)
+            if self._ordenadas is not None:
+                del self._ordenadas[bisect.bisect_left(self._ordenadas, tarea)]
+            self.tareas_completadas.add(nombre)  # Añadimos la tarea al conjunto de completadas
+            self._registrar(linea)  # Anotamos la operación en el registro
 
         if not tarea_encontrada:
             print(f"No se encontró ninguna tarea con el nombre: {nombre}.")
@@ -128,16 +451,14 @@ class GestorTareas:
         Obtiene la siguiente tarea de mayor prioridad sin eliminarla.
         - Verifica que todas las dependencias estén completadas.
         """
-        while self.heap:
-            prioridad, fecha, nombre, dependencias = self.heap[0]
+        # Recorremos las tareas en orden sin modificar el heap: las que aún
+        # tienen dependencias pendientes deben seguir en el sistema
+        for prioridad, fecha, nombre, dependencias in self._tareas_ordenadas():
             # Verificamos si todas las dependencias están completadas
-            if all(dep in self.tareas_completadas for dep in dependencias):
-                print(f"Siguiente tarea de mayor prioridad: {nombre}, Prioridad: {prioridad}, Fecha: {fecha}")
+            if dependencias.issubset(self.tareas_completadas):
+                print(f"Siguiente tarea de mayor prioridad: {nombre}, Prioridad: {prioridad}, Fecha: {_fecha_iso(fecha)}")
                 return
-            else:
-                # Si no se puede ejecutar debido a dependencias, la retiramos temporalmente
-                heapq.heappop(self.heap)
-        
+
         print("No hay tareas disponibles o ejecutables en este momento.")
 
 # SISTEMA DE GESTIÓN DE TAREAS 
@@ -154,6 +475,7 @@ if __name__ == "__main__":
         print("3. Completar tarea")
         print("4. Obtener tarea de mayor prioridad")
         print("5. Salir")
+        print("6. Importar tareas desde CSV")
         print("")
 
         opcion = input("Elige una opción: ")
@@ -173,8 +495,13 @@ if __name__ == "__main__":
             elif opcion == "4":
                 gestor.obtener_tarea_mayor_prioridad()
             elif opcion == "5":
+                gestor.cerrar()  # Guardamos los cambios pendientes antes de salir
                 print("Saliendo del gestor de tareas. ¡Hasta luego!")
                 break
+            elif opcion == "6":
+                ruta = input("Ingrese la ruta del archivo CSV (nombre,prioridad,fecha,dep1;dep2): ")
+                cantidad = gestor.añadir_tareas_lote(leer_tareas_csv(ruta))
+                print(f"Se importaron {cantidad} tareas.")
             else:
                 print("Opción no válida. Intente nuevamente.")
         except ValueError as e:
@@ -0,0 +1,203 @@
+import random
+
+import pytest
+
+from gestion_tareas import GestorTareas, leer_tareas_csv
+
+
+@pytest.fixture
+def ruta(tmp_path):
+    """
+    Ruta de un archivo de persistencia temporal para cada prueba.
+    """
+    return str(tmp_path / "tareas.json")
+
+
+def comprobar_heap(gestor):
+    """
+    Verifica el invariante del heap y que el índice de posiciones sea coherente.
+    """
+    heap = gestor.heap
+    for i in range(1, len(heap)):
+        assert not heap[i] < heap[(i - 1) // 2]
+    assert gestor._pos == {tarea[2]: i for i, tarea in enumerate(heap)}
+    if gestor._ordenadas is not None:
+        assert gestor._ordenadas == sorted(heap)
+
+
+def test_completar_tarea_mantiene_heap_y_posiciones(ruta, capsys):
+    gestor = GestorTareas(ruta)
+    azar = random.Random(0)
+    pendientes = set()
+    for paso in range(1000):
+        if pendientes and azar.random() < 0.4:
+            nombre = azar.choice(sorted(pendientes))
+            gestor.completar_tarea(nombre)
+            pendientes.remove(nombre)
+        else:
+            nombre = f"t{paso}"
+            gestor.añadir_tarea(nombre, azar.randrange(5), f"2024-01-{azar.randrange(1, 29):02d}")
+            pendientes.add(nombre)
+        if paso == 500:
+            gestor.mostrar_tareas_pendientes()  # Activa la vista ordenada
+        comprobar_heap(gestor)
+    assert set(gestor._pos) == pendientes
+    gestor.cerrar()
+
+
+def test_completar_tarea_inexistente_no_modifica_heap(ruta, capsys):
+    gestor = GestorTareas(ruta)
+    gestor.añadir_tarea("a", 1, "2024-01-01")
+    gestor.completar_tarea("b")
+    assert "No se encontró" in capsys.readouterr().out
+    assert [tarea[2] for tarea in gestor.heap] == ["a"]
+    comprobar_heap(gestor)
+    gestor.cerrar()
+
+
+def test_instantanea_y_registro_se_recuperan_al_cargar(ruta, capsys):
+    gestor = GestorTareas(ruta)
+    gestor.añadir_tareas_lote([
+        ("a", 2, "2024-01-01"),
+        ("b", 1, "2024-01-02", ["a"]),
+        ("c", 3, "2024-01-03"),
+    ])
+    gestor.guardar_tareas()  # Instantánea con a, b y c
+    gestor.completar_tarea("a")  # Operaciones que solo quedan en el registro
+    gestor.añadir_tarea("d", 0, "2024-01-04", ["c"])
+    gestor.cerrar()
+
+    recargado = GestorTareas(ruta)
+    assert sorted(recargado.heap) == sorted(gestor.heap)
+    assert recargado._entradas_log == 2
+    comprobar_heap(recargado)
+    recargado.cerrar()
+
+
+def test_registro_con_ultima_linea_incompleta_se_trunca(ruta, capsys):
+    gestor = GestorTareas(ruta)
+    gestor.añadir_tarea("a", 1, "2024-01-01")
+    gestor.cerrar()
+    with open(ruta + ".log", "ab") as registro:
+        registro.write(b'{"op":"add","t":[1,7')  # Escritura interrumpida
+
+    recargado = GestorTareas(ruta)
+    assert [tarea[2] for tarea in recargado.heap] == ["a"]
+    recargado.añadir_tarea("b", 2, "2024-01-02")
+    recargado.cerrar()
+
+    assert sorted(tarea[2] for tarea in GestorTareas(ruta).heap) == ["a", "b"]
+
+
+def test_registro_con_linea_intermedia_corrupta_falla(ruta):
+    with open(ruta + ".log", "wb") as registro:
+        registro.write(b'{"op":"add"\n{"op":"done","nombre":"a"}\n')
+    with pytest.raises(ValueError, match="línea 1"):
+        GestorTareas(ruta)
+
+
+def test_instantanea_de_otra_version_se_reconstruye(ruta):
+    with open(ruta, "wb") as archivo:
+        archivo.write(b'{"v":2,"heap":[[3,738886,"b",[]],[1,738887,"a",[]]]}')
+    gestor = GestorTareas(ruta)
+    assert gestor.heap[0][2] == "a"
+    comprobar_heap(gestor)
+
+
+def test_instantanea_antigua_en_lista_con_fechas_iso(ruta):
+    with open(ruta, "wb") as archivo:
+        archivo.write(b'[[2,"2024-01-02T00:00:00","b",[]],[1,"2024-01-01T00:00:00","a",["b"]]]')
+    gestor = GestorTareas(ruta)
+    assert sorted(gestor.heap) == [
+        (1, 738886, "a", frozenset({"b"})),
+        (2, 738887, "b", frozenset()),
+    ]
+    comprobar_heap(gestor)
+
+
+def test_instantanea_sin_heap_falla(ruta):
+    with open(ruta, "wb") as archivo:
+        archivo.write(b'{"v":2}')
+    with pytest.raises(ValueError, match="no soportada"):
+        GestorTareas(ruta)
+
+
+def test_leer_tareas_csv(tmp_path):
+    archivo = tmp_path / "tareas.csv"
+    archivo.write_text("a, 2, 2024-01-01\n\nb,1,2024-01-02,a; c\n", encoding="utf-8")
+    assert leer_tareas_csv(archivo) == [
+        ("a", 2, "2024-01-01", []),
+        ("b", 1, "2024-01-02", ["a", "c"]),
+    ]
+
+
+@pytest.mark.parametrize("contenido, mensaje", [
+    ("a,1,2024-01-01\nb,2\n", "Línea 2 del CSV: se esperaban al menos 3 campos"),
+    ("nombre,prioridad,fecha\n", "Línea 1 del CSV: la prioridad 'prioridad'"),
+    ("a,1,2024-01-01\nb,2,01/02/2024\n", "Línea 2 del CSV: la fecha '01/02/2024'"),
+])
+def test_leer_tareas_csv_indica_la_linea_erronea(tmp_path, contenido, mensaje):
+    archivo = tmp_path / "tareas.csv"
+    archivo.write_text(contenido, encoding="utf-8")
+    with pytest.raises(ValueError, match=mensaje):
+        leer_tareas_csv(archivo)
+
+
+def test_instantanea_antigua_con_nombres_repetidos_no_pierde_tareas(ruta, capsys):
+    with open(ruta, "wb") as archivo:
+        archivo.write(b'[[1,"2024-01-01T00:00:00","x",[]],[5,"2024-03-01T00:00:00","x",[]]]')
+    gestor = GestorTareas(ruta)
+    assert sorted((tarea[0], tarea[2]) for tarea in gestor.heap) == [(1, "x"), (5, "x (2)")]
+    assert "renombrado como 'x (2)'" in capsys.readouterr().out
+    comprobar_heap(gestor)
+
+
+def test_instantanea_v1_con_nombres_repetidos_se_reconstruye(ruta, capsys):
+    with open(ruta, "wb") as archivo:
+        archivo.write(b'{"v":1,"heap":[[1,738886,"x",[]],[2,738886,"x",[]]]}')
+    gestor = GestorTareas(ruta)
+    comprobar_heap(gestor)
+    gestor.completar_tarea("x")
+    assert [tarea[2] for tarea in gestor.heap] == ["x (2)"]
+    comprobar_heap(gestor)
+    gestor.cerrar()
+
+
+def test_prioridad_no_serializable_no_deja_la_tarea_a_medias(ruta):
+    gestor = GestorTareas(ruta)
+    gestor.añadir_tarea("ok", 1, "2024-01-01")
+    for añadir in (
+        lambda: gestor.añadir_tarea("grande", 10**20, "2024-01-01"),
+        lambda: gestor.añadir_tareas_lote([("otra", 2, "2024-01-01"), ("grande", 10**20, "2024-01-01")]),
+    ):
+        try:
+            añadir()
+        except ValueError:
+            pass  # orjson no admite enteros de más de 64 bits
+    en_memoria = sorted(tarea[2] for tarea in gestor.heap)
+    comprobar_heap(gestor)
+    gestor.cerrar()
+
+    recargado = GestorTareas(ruta)
+    assert sorted(tarea[2] for tarea in recargado.heap) == en_memoria
+    recargado.cerrar()
+
+
+def test_obtener_tarea_mayor_prioridad_no_elimina_tareas_bloqueadas(ruta, capsys):
+    gestor = GestorTareas(ruta)
+    gestor.añadir_tarea("a", 2, "2024-01-01")
+    gestor.añadir_tarea("b", 1, "2024-01-01", ["a"])  # Más prioritaria, pero depende de a
+    capsys.readouterr()
+
+    for _ in range(2):
+        gestor.obtener_tarea_mayor_prioridad()
+        assert "Siguiente tarea de mayor prioridad: a," in capsys.readouterr().out
+    assert "b" in gestor._pos
+    assert "b" in [tarea[2] for tarea in gestor.heap]
+    comprobar_heap(gestor)
+
+    gestor.completar_tarea("a")
+    capsys.readouterr()
+    gestor.obtener_tarea_mayor_prioridad()
+    assert "Siguiente tarea de mayor prioridad: b," in capsys.readouterr().out
+    gestor.cerrar()